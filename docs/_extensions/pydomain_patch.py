@@ -46,4 +46,8 @@ def setup(app):
     domain.object_types["classattribute"] = ObjType(_("classattribute"), "attr", "obj")
     domain.directives["classattribute"] = PyClassAttribute
 
-    return {"version": "patch"}
+    return {
+        "version": "patch",
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
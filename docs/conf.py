@@ -2,28 +2,33 @@
 
 import sys
 import os
+import runpy
 
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(thisdir, "_extensions"))
+sys.path.append(os.path.join(thisdir, "_extensions"))
 sys.path.insert(0, os.path.dirname(thisdir))
 
-import order as od
+# load package infos without importing the package itself
+meta = runpy.run_path(os.path.join(os.path.dirname(thisdir), "order", "__version__.py"))
 
 
-project = od.__name__
-author = od.__author__
-copyright = od.__copyright__
+project = "order"
+author = meta["__author__"]
+copyright = meta["__copyright__"]
 copyright = copyright[10:] if copyright.startswith("Copyright ") else copyright
-version = od.__version__[:od.__version__.index(".", 2)]
-release = od.__version__
+release = meta["__version__"]
+try:
+    version = release[:release.index(".", 2)]
+except ValueError:
+    version = release
 language = "en"
 
 templates_path = ["_templates"]
 html_static_path = ["_static"]
 master_doc = "index"
 source_suffix = ".rst"
-exclude_patterns = []
+exclude_patterns = ["_build", "**/.ipynb_checkpoints"]
 pygments_style = "sphinx"
 add_module_names = False
 
@@ -56,7 +61,7 @@ elif html_theme == "sphinx_book_theme":
         "use_edit_page_button": True,
     })
 
-extensions = [
+extensions = (
     "sphinx.ext.autodoc",
     "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
@@ -65,7 +70,7 @@ extensions = [
     "myst_parser",
     "sphinx_lfs_content",
     "pydomain_patch",
-]
+)
 
 autodoc_member_order = "bysource"
 
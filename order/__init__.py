@@ -2,15 +2,18 @@
 # flake8: noqa
 
 
-__all__ = [
+__all__ = (
     "UniqueObject", "UniqueObjectIndex", "UniqueObjectMeta", "unique_tree",
     "DuplicateObjectException", "DuplicateNameException", "DuplicateIdException",
     "CopyMixin", "AuxDataMixin", "TagMixin", "DataSourceMixin", "SelectionMixin", "LabelMixin",
     "ColorMixin", "CopySpec",
     "Channel", "Category", "Variable", "Shift", "Process", "Dataset", "DatasetInfo", "Campaign",
     "Config", "Analysis",
-]
+)
+
 
+import sys as _sys
+import importlib as _importlib
 
 # package infos
 from order.__version__ import (
@@ -18,20 +21,69 @@ from order.__version__ import (
     __status__, __version__,
 )
 
-# provisioning imports
-import order.util
-from order.unique import (
-    UniqueObject, UniqueObjectIndex, UniqueObjectMeta, unique_tree,
-    DuplicateObjectException, DuplicateNameException, DuplicateIdException,
-)
-from order.mixins import (
-    CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin, SelectionMixin, LabelMixin, ColorMixin,
-    CopySpec,
+# submodules that are imported on first access
+_lazy_modules = (
+    "util", "unique", "mixins", "category", "variable", "shift", "process", "dataset", "config",
+    "analysis",
 )
-from order.category import Channel, Category
-from order.variable import Variable
-from order.shift import Shift
-from order.process import Process
-from order.dataset import Dataset, DatasetInfo
-from order.config import Campaign, Config
-from order.analysis import Analysis
+
+# mapping of public names to the submodules defining them, imported on first access
+_lazy_names = {
+    "UniqueObject": "order.unique",
+    "UniqueObjectIndex": "order.unique",
+    "UniqueObjectMeta": "order.unique",
+    "unique_tree": "order.unique",
+    "DuplicateObjectException": "order.unique",
+    "DuplicateNameException": "order.unique",
+    "DuplicateIdException": "order.unique",
+    "CopyMixin": "order.mixins",
+    "AuxDataMixin": "order.mixins",
+    "TagMixin": "order.mixins",
+    "DataSourceMixin": "order.mixins",
+    "SelectionMixin": "order.mixins",
+    "LabelMixin": "order.mixins",
+    "ColorMixin": "order.mixins",
+    "CopySpec": "order.mixins",
+    "Channel": "order.category",
+    "Category": "order.category",
+    "Variable": "order.variable",
+    "Shift": "order.shift",
+    "Process": "order.process",
+    "Dataset": "order.dataset",
+    "DatasetInfo": "order.dataset",
+    "Campaign": "order.config",
+    "Config": "order.config",
+    "Analysis": "order.analysis",
+}
+
+
+if _sys.version_info >= (3, 7):
+    # lazy loading via module-level __getattr__, see PEP 562
+    # (lookup functions are bound as defaults as the hook is also hit for every unknown attribute)
+    def __getattr__(name, _get=_lazy_names.get, _import=_importlib.import_module):
+        mod_name = _get(name)
+        if mod_name is None:
+            if name in _lazy_modules:
+                # importing the submodule also sets it as an attribute of this package
+                return _import(__name__ + "." + name)
+            raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+        # import the submodule and store all attributes it provides so that __getattr__ is not
+        # called again for any of them
+        mod = _import(mod_name)
+        for attr, _mod_name in _lazy_names.items():
+            if _mod_name == mod_name:
+                globals()[attr] = getattr(mod, attr)
+
+        return globals()[name]
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_names))
+
+else:
+    # no support for module-level __getattr__, so import everything right away
+    for _name in _lazy_modules:
+        _importlib.import_module(__name__ + "." + _name)
+    for _name, _mod_name in _lazy_names.items():
+        globals()[_name] = getattr(_importlib.import_module(_mod_name), _name)
+    del _name, _mod_name
@@ -7,7 +7,7 @@ Pythonic class collection that helps you structure external data from LHC / HEP
 __author__ = "Marcel Rieger"
 __email__ = "github.riga@icloud.com"
 __copyright__ = "Copyright 2018-2024, Marcel Rieger"
-__credits__ = ["Marcel Rieger"]
+__credits__ = ("Marcel Rieger",)
 __contact__ = "https://github.com/riga/order"
 __license__ = "BSD-3-Clause"
 __status__ = "Development"
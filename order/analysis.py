@@ -5,7 +5,7 @@ Definition of the central analysis class.
 """
 
 
-__all__ = ["Analysis"]
+__all__ = ("Analysis",)
 
 
 from order.unique import UniqueObject, unique_tree
@@ -39,9 +39,7 @@ class Analysis(UniqueObject, AuxDataMixin, TagMixin):
     cls_name_plural = "analyses"
 
     def __init__(self, name, id, configs=None, tags=None, aux=None):
-        UniqueObject.__init__(self, name, id)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
+        super(Analysis, self).__init__(name, id, aux=aux, tags=tags)
 
         # set initial configs
         if configs is not None:
@@ -97,8 +95,9 @@ class Analysis(UniqueObject, AuxDataMixin, TagMixin):
         """
         config = self.configs.add(*args, **kwargs)
 
-        # update the config's analysis
-        config.analysis = None
+        # update the config's analysis, only detaching it from a different, previous one
+        if config._analysis is not None and config._analysis is not self:
+            config._analysis.configs.remove(config)
         config._analysis = self
 
         return config
@@ -5,10 +5,12 @@ Classes to describe object that help distinguishing events.
 """
 
 
-__all__ = ["Channel", "Category"]
+__all__ = ("Channel", "Category")
 
 
-from order.unique import UniqueObject, UniqueObjectIndex, unique_tree
+import six
+
+from order.unique import UniqueObject, unique_tree
 from order.mixins import CopyMixin, AuxDataMixin, TagMixin, SelectionMixin, LabelMixin
 from order.util import to_root_latex
 
@@ -158,12 +160,10 @@ class Category(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, SelectionMixin,
             {
                 "attr": "_categories",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Category)),
             },
             {
                 "attr": "_parent_categories",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Category)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -173,6 +173,9 @@ class Category(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, SelectionMixin,
         LabelMixin.copy_specs
     )
 
+    # empty channel, shadowed by an instance attribute once set
+    _channel = None
+
     def __init__(
         self,
         name,
@@ -186,15 +189,16 @@ class Category(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, SelectionMixin,
         tags=None,
         aux=None,
     ):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        SelectionMixin.__init__(self, selection=selection, str_selection_mode=str_selection_mode)
-        LabelMixin.__init__(self, label=label, label_short=label_short)
-
-        # register empty attributes
-        self._channel = None
+        super(Category, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            selection=selection,
+            str_selection_mode=str_selection_mode,
+            label=label,
+            label_short=label_short,
+        )
 
         # set initial values
         self.channel = channel
@@ -218,39 +222,61 @@ class Category(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, SelectionMixin,
     @channel.setter
     def channel(self, channel):
         # channel setter
+        if channel is self._channel:
+            return
+
         if channel is not None and not isinstance(channel, Channel):
             raise TypeError("invalid channel type: {}".format(channel))
 
         # remove this category from the current channels' categories index
-        if self._channel:
+        if self._channel is not None:
             self._channel.categories.remove(self)
 
         # add this category to the channels' categories index
-        if channel:
+        if channel is not None:
             channel.categories.add(self)
 
         self._channel = channel
 
     @property
     def full_label(self):
-        if self.channel:
-            return "{}, {}".format(self.channel.label, self.label)
+        channel = self._channel
+        if channel is not None:
+            return "{}, {}".format(channel.label, self.label)
 
         return self.label
 
     @property
     def full_label_short(self):
-        if self.channel:
-            return "{}, {}".format(self.channel.label_short, self.label_short)
+        channel = self._channel
+        if channel is not None:
+            return "{}, {}".format(channel.label_short, self.label_short)
 
         return self.label_short
 
     @property
     def full_label_root(self):
+        # compose from the cached root labels when both labels are strings, which is equivalent to
+        # converting the full label as the latex conversion is applied per character
+        channel = self._channel
+        if channel is None:
+            return self.label_root
+
+        if isinstance(channel.label, six.string_types) and isinstance(self.label, six.string_types):
+            return channel.label_root + ", " + self.label_root
+
         return to_root_latex(self.full_label)
 
     @property
     def full_label_short_root(self):
+        channel = self._channel
+        if channel is None:
+            return self.label_short_root
+
+        if (isinstance(channel.label_short, six.string_types) and
+                isinstance(self.label_short, six.string_types)):
+            return channel.label_short_root + ", " + self.label_short_root
+
         return to_root_latex(self.full_label_short)
 
 
@@ -325,7 +351,6 @@ class Channel(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, LabelMixin):
             {
                 "attr": "_categories",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Category)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -344,11 +369,14 @@ class Channel(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, LabelMixin):
         tags=None,
         aux=None,
     ):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        LabelMixin.__init__(self, label=label, label_short=label_short)
+        super(Channel, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            label=label,
+            label_short=label_short,
+        )
 
         # set initial categories
         if categories is not None:
@@ -362,8 +390,9 @@ class Channel(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, LabelMixin):
         """
         category = self.categories.add(*args, **kwargs)
 
-        # update the category's channel
-        category.channel = None
+        # update the category's channel, only detaching it from a different, previous one
+        if category._channel is not None and category._channel is not self:
+            category._channel.categories.remove(category)
         category._channel = self
 
         return category
@@ -6,10 +6,10 @@ config.
 """
 
 
-__all__ = ["Campaign", "Config"]
+__all__ = ("Campaign", "Config")
 
 
-from order.unique import UniqueObject, UniqueObjectIndex, unique_tree
+from order.unique import UniqueObject, unique_tree
 from order.mixins import CopyMixin, AuxDataMixin, TagMixin
 from order.shift import Shift
 from order.dataset import Dataset
@@ -88,7 +88,6 @@ class Campaign(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
             {
                 "attr": "_datasets",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Dataset)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -97,9 +96,7 @@ class Campaign(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
     )
 
     def __init__(self, name, id, ecm=None, bx=None, datasets=None, tags=None, aux=None):
-        UniqueObject.__init__(self, name, id)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
+        super(Campaign, self).__init__(name, id, aux=aux, tags=tags)
 
         # instance members
         self._ecm = None
@@ -138,8 +135,9 @@ class Campaign(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
         """
         dataset = self.datasets.add(*args, **kwargs)
 
-        # update the dataset's campaign
-        dataset.campaign = None
+        # update the dataset's campaign, only detaching it from a different, previous one
+        if dataset._campaign is not None and dataset._campaign is not self:
+            dataset._campaign.datasets.remove(dataset)
         dataset._campaign = self
 
         return dataset
@@ -265,32 +263,26 @@ class Config(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
             {
                 "attr": "_datasets",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Dataset)),
             },
             {
                 "attr": "_processes",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Process)),
             },
             {
                 "attr": "_channels",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Channel)),
             },
             {
                 "attr": "_categories",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Category)),
             },
             {
                 "attr": "_variables",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Variable)),
             },
             {
                 "attr": "_shifts",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Shift)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -320,40 +312,33 @@ class Config(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
         # if name or id are None, campaign must be set
         # use the campaign setter for type validation first
         self.campaign = campaign
-        if name is None:
-            if self.campaign is None:
-                raise ValueError("a name must be set when campaign is missing")
-            name = self.campaign.name
-        if id is None:
-            if self.campaign is None:
-                raise ValueError("an id must be set when campaign is missing")
-            id = self.campaign.id
-
-        UniqueObject.__init__(self, name=name, id=id)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
+        campaign = self._campaign
+        if name is None or id is None:
+            if campaign is None:
+                missing = "a name" if name is None else "an id"
+                raise ValueError("{} must be set when campaign is missing".format(missing))
+            if name is None:
+                name = campaign.name
+            if id is None:
+                id = campaign.id
+
+        super(Config, self).__init__(name, id, aux=aux, tags=tags)
 
         # set initial values
         if analysis is not None:
             self.analysis = analysis
 
-        if datasets is not None:
-            self.extend_datasets(datasets)
-
-        if processes is not None:
-            self.extend_processes(processes)
-
-        if channels is not None:
-            self.extend_channels(channels)
-
-        if categories is not None:
-            self.extend_categories(categories)
-
-        if variables is not None:
-            self.extend_variables(variables)
-
-        if shifts is not None:
-            self.extend_shifts(shifts)
+        # set initial child objects, only binding extend methods that are actually needed
+        for plural, objs in (
+            ("datasets", datasets),
+            ("processes", processes),
+            ("channels", channels),
+            ("categories", categories),
+            ("variables", variables),
+            ("shifts", shifts),
+        ):
+            if objs is not None:
+                getattr(self, "extend_" + plural)(objs)
 
     def copy(self, *args, **kwargs):
         inst = super(Config, self).copy(*args, **kwargs)
@@ -380,19 +365,22 @@ class Config(UniqueObject, CopyMixin, AuxDataMixin, TagMixin):
     @analysis.setter
     def analysis(self, analysis):
         # analysis setter
-        if analysis is not None and not isinstance(analysis, Analysis):
+        if analysis is self._analysis:
+            return
+
+        if analysis is not None and not isinstance(analysis, order.analysis.Analysis):
             raise TypeError("invalid analysis type: {}".format(analysis))
 
         # remove this config from the current analysis' config index
-        if self._analysis:
+        if self._analysis is not None:
             self._analysis.configs.remove(self)
 
         # add this config to the analysis' config index
-        if analysis:
+        if analysis is not None:
             analysis.configs.add(self)
 
         self._analysis = analysis
 
 
 # prevent circular imports
-from order.analysis import Analysis
+import order.analysis
@@ -5,12 +5,12 @@ Classes to define datasets.
 """
 
 
-__all__ = ["Dataset", "DatasetInfo"]
+__all__ = ("Dataset", "DatasetInfo")
 
 
 import six
 
-from order.unique import UniqueObject, UniqueObjectIndex, unique_tree
+from order.unique import UniqueObject, unique_tree
 from order.mixins import CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin, LabelMixin
 from order.process import Process
 from order.shift import Shift
@@ -172,7 +172,6 @@ class Dataset(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin,
             {
                 "attr": "_processes",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Process)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -196,12 +195,15 @@ class Dataset(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin,
         aux=None,
         **kwargs  # noqa: C816
     ):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        DataSourceMixin.__init__(self, is_data=is_data)
-        LabelMixin.__init__(self, label=label, label_short=label_short)
+        super(Dataset, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            is_data=is_data,
+            label=label,
+            label_short=label_short,
+        )
 
         # instance members
         self._campaign = None
@@ -242,39 +244,53 @@ class Dataset(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin,
     @campaign.setter
     def campaign(self, campaign):
         # campaign setter
-        if campaign is not None and not isinstance(campaign, Campaign):
+        if campaign is self._campaign:
+            return
+
+        if campaign is not None and not isinstance(campaign, order.config.Campaign):
             raise TypeError("invalid campaign type: {}".format(campaign))
 
         # remove this dataset from the current campaign's dataset index
-        if self._campaign:
+        if self._campaign is not None:
             self._campaign.datasets.remove(self)
 
         # add this dataset to the campaign's dataset index
-        if campaign:
+        if campaign is not None:
             campaign.datasets.add(self)
 
         self._campaign = campaign
 
+    @classmethod
+    def _parse_info_entry(cls, name, obj):
+        if not isinstance(name, six.string_types):
+            raise TypeError("invalid info name type: {}".format(name))
+        if not isinstance(obj, DatasetInfo):
+            if not isinstance(obj, dict):
+                try:
+                    obj = dict(obj)
+                except (TypeError, ValueError):
+                    raise TypeError("invalid info value type: {}".format(obj))
+            obj = DatasetInfo(**obj)
+
+        return six.moves.intern(str(name)), obj
+
     @typed
     def info(self, info):
-        # info parser
-        try:
-            info = dict(info)
-        except:
-            raise TypeError("invalid info type: {}".format(info))
+        # info parser, plain dicts are only read below so they need no copy
+        if type(info) is not dict:
+            try:
+                info = dict(info)
+            except (TypeError, ValueError):
+                raise TypeError("invalid info type: {}".format(info))
 
         _info = {}
         for name, obj in info.items():
-            if not isinstance(name, six.string_types):
-                raise TypeError("invalid info name type: {}".format(name))
-            if not isinstance(obj, DatasetInfo):
-                if not isinstance(obj, dict):
-                    try:
-                        obj = dict(obj)
-                    except:
-                        raise TypeError("invalid info value type: {}".format(obj))
-                obj = DatasetInfo(**obj)
-            _info[str(name)] = obj
+            # entries that need no coercion are stored directly, all others are parsed
+            if type(name) is str and isinstance(obj, DatasetInfo):
+                name = six.moves.intern(name)
+            else:
+                name, obj = self._parse_info_entry(name, obj)
+            _info[name] = obj
 
         return _info
 
@@ -282,35 +298,35 @@ class Dataset(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin,
         """
         Sets an :py:class:`DatasetInfo` object *info* for a given *name*. Returns the object.
         """
-        name, info = list(self.__class__.info.fparse(self, {name: info}).items())[0]
-        self.info[name] = info
+        name, info = self._parse_info_entry(name, info)
+        self._info[name] = info
         return info
 
     def get_info(self, name):
         """
         Returns the :py:class:`DatasetInfo` object for a given *name*.
         """
-        return self.info[name]
+        return self._info[name]
 
     @property
     def keys(self):
         # keys getter, nominal info object
-        return self.info[Shift.NOMINAL].keys
+        return self._info[Shift.NOMINAL].keys
 
     @property
     def n_files(self):
         # n_files getter, nominal info object
-        return self.info[Shift.NOMINAL].n_files
+        return self._info[Shift.NOMINAL].n_files
 
     @property
     def n_events(self):
         # n_events getter, nominal info object
-        return self.info[Shift.NOMINAL].n_events
+        return self._info[Shift.NOMINAL].n_events
 
     @property
     def gen_order(self):
         # gen_order getter, nominal info object
-        return self.info[Shift.NOMINAL].gen_order
+        return self._info[Shift.NOMINAL].gen_order
 
 
 class DatasetInfo(CopyMixin, AuxDataMixin, TagMixin):
@@ -361,22 +377,23 @@ class DatasetInfo(CopyMixin, AuxDataMixin, TagMixin):
         TagMixin.copy_specs
     )
 
+    # empty generator order, shadowed by an instance attribute once set
+    _gen_order = None
+
     def __init__(self, keys=None, n_files=-1, n_events=-1, gen_order=None, tags=None, aux=None):
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
+        super(DatasetInfo, self).__init__(aux=aux, tags=tags)
 
         # instance members
         self._keys = []
         self._n_files = -1
         self._n_events = -1
 
-        # set initial values
+        # set initial values, skipping the parsers for arguments that equal the defaults
         if keys is not None:
             self.keys = keys
-        if n_files is not None:
+        if n_files is not None and n_files != -1:
             self.n_files = n_files
-        if n_events is not None:
+        if n_events is not None and n_events != -1:
             self.n_events = n_events
         if gen_order is not None:
             self.gen_order = gen_order
@@ -384,8 +401,14 @@ class DatasetInfo(CopyMixin, AuxDataMixin, TagMixin):
     @typed
     def keys(self, keys):
         # keys parser
+        keys = make_list(keys)
+
+        # fast path for the common case of plain strings, make_list already returned a new list
+        if all(type(key) is str for key in keys):
+            return keys
+
         _keys = []
-        for key in make_list(keys):
+        for key in keys:
             if not isinstance(key, six.string_types):
                 raise TypeError("invalid key type: {}".format(key))
             _keys.append(str(key))
@@ -422,4 +445,4 @@ class DatasetInfo(CopyMixin, AuxDataMixin, TagMixin):
 
 
 # prevent circular imports
-from order.config import Campaign
+import order.config
@@ -5,10 +5,10 @@ Mixin classes providing common functionality.
 """
 
 
-__all__ = [
+__all__ = (
     "CopyMixin", "AuxDataMixin", "TagMixin", "DataSourceMixin", "SelectionMixin", "LabelMixin",
     "ColorMixin", "CopySpec",
-]
+)
 
 
 import sys
@@ -247,10 +247,12 @@ class CopyMixin(object):
         # ensure that specs contain CopySpec objects
         # also remove duplicates, priotize last occurances
         _specs = []
+        seen_dsts = set()
 
         for spec in specs[::-1]:
             spec = CopySpec.new(spec.__dict__ if isinstance(spec, CopySpec) else spec)
-            if spec not in _specs:
+            if spec.dst not in seen_dsts:
+                seen_dsts.add(spec.dst)
                 _specs.append(spec)
 
         return _specs[::-1]
@@ -404,8 +406,8 @@ class AuxDataMixin(object):
 
     copy_specs = []
 
-    def __init__(self, aux=None):
-        super(AuxDataMixin, self).__init__()
+    def __init__(self, aux=None, **kwargs):
+        super(AuxDataMixin, self).__init__(**kwargs)
 
         # instance members
         self._aux = collections.OrderedDict()
@@ -520,8 +522,8 @@ class TagMixin(object):
 
     copy_specs = []
 
-    def __init__(self, tags=None):
-        super(TagMixin, self).__init__()
+    def __init__(self, tags=None, **kwargs):
+        super(TagMixin, self).__init__(**kwargs)
 
         # instance members
         self._tags = set()
@@ -542,7 +544,7 @@ class TagMixin(object):
         for tag in tags:
             if not isinstance(tag, six.string_types):
                 raise TypeError("invalid tag type: {}".format(tag))
-            _tags.add(str(tag))
+            _tags.add(six.moves.intern(str(tag)))
 
         return _tags
 
@@ -647,8 +649,8 @@ class DataSourceMixin(object):
 
     copy_specs = []
 
-    def __init__(self, is_data=False):
-        super(DataSourceMixin, self).__init__()
+    def __init__(self, is_data=False, **kwargs):
+        super(DataSourceMixin, self).__init__(**kwargs)
 
         # instance members
         self._is_data = None
@@ -785,8 +787,8 @@ class SelectionMixin(object):
 
     copy_specs = []
 
-    def __init__(self, selection=None, str_selection_mode=None):
-        super(SelectionMixin, self).__init__()
+    def __init__(self, selection=None, str_selection_mode=None, **kwargs):
+        super(SelectionMixin, self).__init__(**kwargs)
 
         # instance members
         self._selection = "1"
@@ -930,12 +932,16 @@ class LabelMixin(object):
 
     copy_specs = []
 
-    def __init__(self, label=None, label_short=None):
-        super(LabelMixin, self).__init__()
+    # caches of (label, root label) pairs, refreshed whenever the label object changes
+    _label_root_cache = None
+    _label_short_root_cache = None
+
+    # empty labels, shadowed by instance attributes once set
+    _label = None
+    _label_short = None
 
-        # register empty attributes
-        self._label = None
-        self._label_short = None
+    def __init__(self, label=None, label_short=None, **kwargs):
+        super(LabelMixin, self).__init__(**kwargs)
 
         # set initial values
         if label is not None:
@@ -960,14 +966,18 @@ class LabelMixin(object):
         if label is None:
             self._label = None
         elif isinstance(label, six.string_types):
-            self._label = str(label)
+            self._label = six.moves.intern(str(label))
         else:
             raise TypeError("invalid label type: {}".format(label))
 
     @property
     def label_root(self):
         # label_root getter
-        return to_root_latex(self.label)
+        label = self.label
+        cache = self._label_root_cache
+        if cache is None or cache[0] is not label:
+            cache = self._label_root_cache = (label, to_root_latex(label))
+        return cache[1]
 
     @property
     def label_short(self):
@@ -980,14 +990,18 @@ class LabelMixin(object):
         if label_short is None:
             self._label_short = None
         elif isinstance(label_short, six.string_types):
-            self._label_short = str(label_short)
+            self._label_short = six.moves.intern(str(label_short))
         else:
             raise TypeError("invalid label_short type: {}".format(label_short))
 
     @property
     def label_short_root(self):
         # label_short_root getter
-        return to_root_latex(self.label_short)
+        label_short = self.label_short
+        cache = self._label_short_root_cache
+        if cache is None or cache[0] is not label_short:
+            cache = self._label_short_root_cache = (label_short, to_root_latex(label_short))
+        return cache[1]
 
 
 class ColorMixin(object):
@@ -1247,8 +1261,8 @@ class ColorMixin(object):
 
     copy_specs = []
 
-    def __init__(self, color=None, color1=None, color2=None, color3=None):
-        super(ColorMixin, self).__init__()
+    def __init__(self, color=None, color1=None, color2=None, color3=None, **kwargs):
+        super(ColorMixin, self).__init__(**kwargs)
 
         # instance members
         self._color1_set = False
@@ -5,7 +5,7 @@ Classes to define physics processes.
 """
 
 
-__all__ = ["Process"]
+__all__ = ("Process",)
 
 
 import sys
@@ -13,7 +13,7 @@ import sys
 import six
 from scinum import Number
 
-from order.unique import UniqueObject, UniqueObjectIndex, unique_tree
+from order.unique import UniqueObject, unique_tree
 from order.mixins import CopyMixin, AuxDataMixin, TagMixin, DataSourceMixin, LabelMixin, ColorMixin
 from order.util import typed
 
@@ -121,12 +121,10 @@ class Process(
             {
                 "attr": "_processes",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Process)),
             },
             {
                 "attr": "_parent_processes",
                 "skip_shallow": True,
-                "skip_value": CopyMixin.Deferred(lambda inst: UniqueObjectIndex(cls=Process)),
             },
         ] +
         UniqueObject.copy_specs +
@@ -153,13 +151,19 @@ class Process(
         tags=None,
         aux=None,
     ):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        DataSourceMixin.__init__(self, is_data=is_data)
-        LabelMixin.__init__(self, label=label, label_short=label_short)
-        ColorMixin.__init__(self, color=color, color1=color1, color2=color2, color3=color3)
+        super(Process, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            is_data=is_data,
+            label=label,
+            label_short=label_short,
+            color=color,
+            color1=color1,
+            color2=color2,
+            color3=color3,
+        )
 
         # instance members
         self._xsecs = {}
@@ -214,7 +218,7 @@ class Process(
         `scinum.Number <https://scinum.readthedocs.io/en/latest/#number>`__ instance, it is
         converted to one. The (probably converted) value is returned.
         """
-        key, xsec = list(self.__class__.xsecs.fparse(self, {key: xsec}).items())[0]
+        key, xsec = next(iter(self.__class__.xsecs.fparse(self, {key: xsec}).items()))
         self.xsecs[key] = xsec
         return xsec
 
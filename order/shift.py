@@ -5,7 +5,7 @@ Classes and helpers to describe and work with systematic shifts.
 """
 
 
-__all__ = ["Shift"]
+__all__ = ("Shift",)
 
 
 import scinum as sn
@@ -235,11 +235,14 @@ class Shift(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, LabelMixin):
         raise ValueError("unknown shift direction: {}".format(direction))
 
     def __init__(self, name, id, type=None, label=None, label_short=None, tags=None, aux=None):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        LabelMixin.__init__(self, label=label, label_short=label_short)
+        super(Shift, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            label=label,
+            label_short=label_short,
+        )
 
         # register empty attributes
         self._source = None
@@ -5,11 +5,11 @@ Classes that define unique objects and the index to store them.
 """
 
 
-__all__ = [
+__all__ = (
     "UniqueObject", "UniqueObjectIndex",
     "DuplicateObjectException", "DuplicateNameException", "DuplicateIdException",
     "unique_tree",
-]
+)
 
 
 import collections
@@ -104,8 +104,6 @@ class UniqueObjectIndex(CopyMixin):
     ]
 
     def __init__(self, cls, objects=None, lazy_factories=None):
-        CopyMixin.__init__(self)
-
         # set the cls using the typed parser
         self._cls = None
         self._cls = self.__class__.cls.fparse(self, cls)
@@ -302,20 +300,88 @@ class UniqueObjectIndex(CopyMixin):
     def extend(self, objs, overwrite=False):
         """
         Adds multiple new objects to the index. All elements of the sequence *objs*, as well as
-        *overwrite*, are forwarded to :py:meth:`add` and the added objects are returned in a list.
+        *overwrite*, are handled as in :py:meth:`add` and the added objects are returned in a list.
         When an object is a dictionary or a tuple, it is expanded for the invocation of
-        :py:meth:`add`.
+        :py:meth:`add`. When a subclass overrides :py:meth:`add`, it is called for every object.
         """
         results = []
 
+        # forward all objects to add() when a subclass overrides it
+        get_func = six.get_unbound_function
+        if get_func(self.__class__.add) is not get_func(UniqueObjectIndex.add):
+            for obj in objs:
+                if isinstance(obj, dict):
+                    obj = self.add(overwrite=overwrite, **obj)
+                elif isinstance(obj, tuple):
+                    obj = self.add(*obj, overwrite=overwrite)
+                else:
+                    obj = self.add(obj, overwrite=overwrite)
+                results.append(obj)
+            return results
+
+        index = self._index
+
+        # transient name and id lookups to avoid scanning the index for every added object, they
+        # are only used as long as names and ids in the index are unique and no other code modified
+        # the index in between, e.g. a constructor that registers the new object itself
+        names = {}
+        ids = {}
+        for _obj in index:
+            names[_obj.name] = _obj
+            ids[_obj.id] = _obj
+        bulk = len(names) == len(ids) == len(index)
+        n = len(index)
+        last = index[-1] if n else None
+
         for obj in objs:
+            # determine the object to add
             if isinstance(obj, dict):
-                obj = dict(obj)
-                obj = self.add(overwrite=overwrite, **obj)
+                obj = self._cls(**obj)
             elif isinstance(obj, tuple):
-                obj = self.add(*obj, overwrite=overwrite)
-            else:
-                obj = self.add(obj, overwrite=overwrite)
+                obj = obj[0] if len(obj) == 1 and isinstance(obj[0], self._cls) else self._cls(*obj)
+            elif not isinstance(obj, self._cls):
+                obj = self._cls(obj)
+
+            # find objects in the index with the same name or id
+            if bulk:
+                bulk = len(index) == n and (index[-1] if n else None) is last
+            if bulk:
+                dup = names.get(obj.name)
+                id_dup = ids.get(obj.id)
+                if dup is None:
+                    dup = id_dup
+                elif id_dup is not None and id_dup is not dup:
+                    # add() only removes the first of two different duplicates
+                    bulk = False
+
+            # fall back to add() when the lookups cannot be trusted
+            if not bulk:
+                results.append(self.add(obj, overwrite=overwrite))
+                continue
+
+            # check if obj is a duplicate and whether it should overwrite or cause an exception
+            if dup is not None:
+                if not overwrite:
+                    if dup.name == obj.name:
+                        raise DuplicateNameException(self._cls, obj.name)
+                    raise DuplicateIdException(self._cls, obj.id)
+                index.remove(dup)
+                del names[dup.name]
+                del ids[dup.id]
+
+            # also check for lazy factories
+            if obj.name in self._lazy_factories:
+                if not overwrite:
+                    raise DuplicateNameException(self._cls, obj.name)
+                self._lazy_factories.pop(obj.name)
+
+            # add to the index
+            index.append(obj)
+            names[obj.name] = obj
+            ids[obj.id] = obj
+            n = len(index)
+            last = obj
+
             results.append(obj)
 
         return results
@@ -354,7 +420,7 @@ class UniqueObjectIndex(CopyMixin):
         """
         if len(self) > 0:
             if not self._index:
-                self._build_lazy_object(list(self._lazy_factories.keys())[0])
+                self._build_lazy_object(next(iter(self._lazy_factories)))
             return self._index[0]
 
         # default
@@ -509,8 +575,8 @@ class UniqueObject(six.with_metaclass(UniqueObjectMeta)):
 
     copy_specs = []
 
-    def __init__(self, name, id):
-        super(UniqueObject, self).__init__()
+    def __init__(self, name, id, **kwargs):
+        super(UniqueObject, self).__init__(**kwargs)
 
         # register empty attributes
         self._name = None
@@ -629,7 +695,7 @@ class UniqueObject(six.with_metaclass(UniqueObjectMeta)):
         if not isinstance(name, six.string_types):
             raise TypeError("invalid name type: {}".format(name))
 
-        return str(name)
+        return six.moves.intern(str(name))
 
     @typed
     def id(self, id):
@@ -691,7 +757,8 @@ def unique_tree(**kwargs):
     normally be created.
 
     A class can be decorated multiple times. Internally, the objects are stored in a separated
-    :py:class:`UniqueObjectIndex` instance per added tree functionality.
+    :py:class:`UniqueObjectIndex` instance per added tree functionality, which is only created when
+    it is first accessed.
 
     Doc strings are automatically created.
     """
@@ -750,21 +817,11 @@ def unique_tree(**kwargs):
                 return f
             return decorator
 
-        # patch the init method
-        orig_init = decorated_cls.__init__
-        def __init__(self, *args, **kwargs):
-            # register the child index
-            child_index = UniqueObjectIndex(cls=cls)
-            setattr(self, "_" + plural, child_index)
-
-            # register the child index
-            if parents:
-                parent_index = UniqueObjectIndex(cls=cls)
-                setattr(self, "_parent_" + plural, parent_index)
-
-            # call the original inint
-            orig_init(self, *args, **kwargs)
-        decorated_cls.__init__ = __init__
+        # the child index and optionally the parent index are created lazily on first access, so
+        # empty defaults are stored on the class
+        setattr(decorated_cls, "_" + plural, None)
+        if parents:
+            setattr(decorated_cls, "_parent_" + plural, None)
 
         # add info about children, parents and whether they are deep
         if getattr(decorated_cls, "_child_classes", None) is None:
@@ -807,6 +864,19 @@ def unique_tree(**kwargs):
         # helpers for child and parent methods
         #
 
+        # index getter helper that creates the index on first access
+        def _get_index(self, attr):
+            index = getattr(self, attr)
+            if index is None:
+                index = UniqueObjectIndex(cls=cls)
+                setattr(self, attr, index)
+            return index
+
+        # index values helper for read-only traversals that must not create indices
+        def _index_values(self, attr):
+            index = getattr(self, attr)
+            return [] if index is None else index.values()
+
         # extend helper
         def _extend(self, add_fn, index, objs, overwrite=True):
             results = []
@@ -882,10 +952,9 @@ def unique_tree(**kwargs):
         #
 
         # direct child index access
-        @patch()
-        @typed(setter=False, name=plural)
+        @patch(plural, prop=True)
         def get_index(self):
-            pass
+            return _get_index(self, "_" + plural)
 
         # has children property
         @patch("has_" + plural, prop=True)
@@ -893,7 +962,8 @@ def unique_tree(**kwargs):
             """
             Returns *True* when this {singular} has child {plural}, *False* otherwise.
             """
-            return len(getattr(self, plural)) > 0
+            index = getattr(self, "_" + plural)
+            return index is not None and len(index) > 0
 
         # is leaf property
         @patch("is_leaf_" + singular, prop=True)
@@ -901,7 +971,8 @@ def unique_tree(**kwargs):
             """
             Returns *True* when this {singular} has no child {plural}, *False* otherwise.
             """
-            return len(getattr(self, plural)) == 0
+            index = getattr(self, "_" + plural)
+            return index is None or len(index) == 0
 
         if not deep_children:
 
@@ -949,14 +1020,16 @@ def unique_tree(**kwargs):
                 recursive through potentially nested child {plural}. When no {singular} is found,
                 *default* is returned when set. Otherwise, an error is raised.
                 """
-                indexes = [getattr(self, plural)]
-                while len(indexes) > 0:
-                    index = indexes.pop(0)
+                indexes = collections.deque([getattr(self, "_" + plural)])
+                while indexes:
+                    index = indexes.popleft()
+                    if index is None:
+                        continue
                     _obj = index.get(obj, default=_not_found)
                     if _obj != _not_found:
                         return _obj
                     if deep:
-                        indexes.extend(getattr(_obj, plural) for _obj in index)
+                        indexes.extend(getattr(_obj, "_" + plural) for _obj in index)
 
                 # default
                 if default != _no_default:
@@ -987,7 +1060,7 @@ def unique_tree(**kwargs):
                 """
                 return _walk(
                     self,
-                    (lambda obj: getattr(obj, plural).values()),
+                    (lambda obj: _index_values(obj, "_" + plural)),
                     algo=algo,
                     depth_first=depth_first,
                     include_self=include_self,
@@ -1021,6 +1094,7 @@ def unique_tree(**kwargs):
                 :py:meth:`UniqueObjectIndex.add` for more info.
                 """
                 return getattr(self, plural).add(*args, **kwargs)
+            generated_add = add
 
             # extend children
             @patch("extend_" + plural)
@@ -1029,7 +1103,13 @@ def unique_tree(**kwargs):
                 Adds multiple child {plural} to the :py:attr:`{plural}` index and returns the added
                 objects in a list.
                 """
-                _extend(self, getattr(self, "add_" + singular), getattr(self, plural), objs)
+                add_fn = getattr(self, "add_" + singular)
+
+                # without a custom add method, all objects can be added to the index in bulk
+                if getattr(add_fn, "__func__", None) is generated_add:
+                    return getattr(self, plural).extend(objs, overwrite=True)
+
+                return _extend(self, add_fn, getattr(self, plural), objs)
 
             # remove child method
             @patch("remove_" + singular)
@@ -1114,7 +1194,12 @@ def unique_tree(**kwargs):
                     :py:attr:`parent_{plural}` index of the added {singular}. An exception is raised
                     when the number of allowed parents of a child {singular} is exceeded.
                     """
-                    _extend(self, getattr(self, "add_" + singular), getattr(self, plural), objs)
+                    return _extend(
+                        self,
+                        getattr(self, "add_" + singular),
+                        getattr(self, plural),
+                        objs,
+                    )
 
         #
         # child methods, enabled and unlimited number of parents
@@ -1142,17 +1227,21 @@ def unique_tree(**kwargs):
                     returns the added objects in a list. Also adds *this* {singular} to the
                     :py:attr:`parent_{plural}` index of the added {singular}.
                     """
-                    _extend(self, getattr(self, "add_" + singular), getattr(self, plural), objs)
+                    return _extend(
+                        self,
+                        getattr(self, "add_" + singular),
+                        getattr(self, plural),
+                        objs,
+                    )
 
         #
         # parent methods, independent of number
         #
 
             # direct parent index access
-            @patch()  # noqa: F811
-            @typed(setter=False, name="parent_" + plural)
+            @patch("parent_" + plural, prop=True)  # noqa: F811
             def get_index(self):  # noqa: F811
-                pass
+                return _get_index(self, "_parent_" + plural)
 
             # has parent index property
             @patch("has_parent_" + plural, prop=True)
@@ -1160,7 +1249,8 @@ def unique_tree(**kwargs):
                 """
                 Returns *True* when this {singular} has parent {plural}, *False* otherwise.
                 """
-                return len(getattr(self, "parent_" + plural)) > 0
+                index = getattr(self, "_parent_" + plural)
+                return index is not None and len(index) > 0
 
             # is_root property
             @patch("is_root_" + singular, prop=True)
@@ -1168,7 +1258,8 @@ def unique_tree(**kwargs):
                 """
                 Returns *True* when this {singular} has no parent {plural}, *False* otherwise.
                 """
-                return len(getattr(self, "parent_" + plural)) == 0
+                index = getattr(self, "_parent_" + plural)
+                return index is None or len(index) == 0
 
             # clear parents
             @patch("clear_parent_" + plural)  # noqa: F811
@@ -1230,14 +1321,16 @@ def unique_tree(**kwargs):
                     {singular} is found, *default* is returned when set. Otherwise, an error is
                     raised.
                     """
-                    indexes = [getattr(self, "parent_" + plural)]
-                    while len(indexes) > 0:
-                        index = indexes.pop(0)
+                    indexes = collections.deque([getattr(self, "_parent_" + plural)])
+                    while indexes:
+                        index = indexes.popleft()
+                        if index is None:
+                            continue
                         _obj = index.get(obj, default=_not_found)
                         if _obj != _not_found:
                             return _obj
                         if deep:
-                            indexes.extend(getattr(_obj, "parent_" + plural) for _obj in index)
+                            indexes.extend(getattr(_obj, "_parent_" + plural) for _obj in index)
 
                     # default
                     if default != _no_default:
@@ -1268,7 +1361,7 @@ def unique_tree(**kwargs):
                     """
                     return _walk(
                         self,
-                        (lambda obj: getattr(obj, "parent_" + plural).values()),
+                        (lambda obj: _index_values(obj, "_parent_" + plural)),
                         algo=algo,
                         depth_first=depth_first,
                         include_self=include_self,
@@ -1301,7 +1394,7 @@ def unique_tree(**kwargs):
                     if len(index) != 1:
                         return None
 
-                    return list(index.values())[0]
+                    return index.get_first()
 
                 # remove parent method
                 @patch("remove_parent_" + singular)  # noqa: F811
@@ -1374,7 +1467,7 @@ def unique_tree(**kwargs):
                     :py:attr:`{plural}` index of the added {singular}. An exception is raised when
                     the number of allowed parent {plural} is exceeded.
                     """
-                    _extend(
+                    return _extend(
                         self,
                         getattr(self, "add_parent_" + singular),
                         getattr(self, "parent_" + plural),
@@ -1407,7 +1500,7 @@ def unique_tree(**kwargs):
                     returns the added objects in a list. Also adds *this* {singular} to the
                     :py:attr:`{plural}` index of the added {singular}.
                     """
-                    _extend(
+                    return _extend(
                         self,
                         getattr(self, "add_parent_" + singular),
                         getattr(self, "parent_" + plural),
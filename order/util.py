@@ -5,18 +5,17 @@ Helpful utilities.
 """
 
 
-__all__ = [
+__all__ = (
     "ROOT_DEFAULT", "typed", "make_list", "multi_match", "flatten", "to_root_latex",
     "join_root_selection", "join_numexpr_selection", "class_id", "args_to_kwargs", "DotAccessProxy",
-]
+)
 
 
 import os
-import functools
+import operator
 import types
 import re
 import fnmatch
-import inspect
 
 import six
 
@@ -81,11 +80,14 @@ class typed(property):
 
             # call the super constructor with generated methods
             property.__init__(self,
-                functools.wraps(fparse)(self._fget(m_name)),
+                self._fget(m_name),
                 self._fset(m_name) if setter else None,
                 self._fdel(m_name) if deleter else None,
             )
 
+            # the getter cannot carry the doc string, so set it on the property itself
+            self.__doc__ = fparse.__doc__
+
     def __call__(self, fparse):
         return self.__class__(fparse, *self._args)
 
@@ -93,18 +95,20 @@ class typed(property):
         """
         Build and returns the property's *fget* method for the member defined by *name*.
         """
-        def fget(inst):
-            return getattr(inst, name)
-        return fget
+        # attrgetter is implemented in C and saves a python frame per access
+        return operator.attrgetter(name)
 
     def _fset(self, name):
         """
         Build and returns the property's *fdel* method for the member defined by *name*.
         """
+        # bind the parser once instead of looking it up on every call
+        fparse = self.fparse
+
         def fset(inst, value):
             # the setter uses the wrapped function as well
             # to allow for value checks
-            value = self.fparse(inst, value)
+            value = fparse(inst, value)
             setattr(inst, name, value)
         return fset
 
@@ -311,6 +315,9 @@ def args_to_kwargs(func, args):
             ...
             return func(**kwargs)
     """
+    # inspect is rather heavy to import and only needed here, so defer it until first use
+    import inspect
+
     if six.PY2:
         ismethod = inspect.ismethod(func)
         arg_names = inspect.getargspec(func).args[int(ismethod):]
@@ -5,7 +5,7 @@ Tools to work with variables.
 """
 
 
-__all__ = ["Variable"]
+__all__ = ("Variable",)
 
 import warnings
 
@@ -281,11 +281,14 @@ class Variable(UniqueObject, CopyMixin, AuxDataMixin, TagMixin, SelectionMixin):
         discrete_x=None,
         discrete_y=None,
     ):
-        UniqueObject.__init__(self, name, id)
-        CopyMixin.__init__(self)
-        AuxDataMixin.__init__(self, aux=aux)
-        TagMixin.__init__(self, tags=tags)
-        SelectionMixin.__init__(self, selection=selection, str_selection_mode=str_selection_mode)
+        super(Variable, self).__init__(
+            name,
+            id,
+            aux=aux,
+            tags=tags,
+            selection=selection,
+            str_selection_mode=str_selection_mode,
+        )
 
         # instance members
         self._expression = None
@@ -23,3 +23,4 @@ from .test_dataset import *
 from .test_config import *
 from .test_analysis import *
 from .test_pickle import *
+from .test_import import *
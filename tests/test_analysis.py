@@ -27,3 +27,20 @@ class AnalysisTest(unittest.TestCase):
         cf.analysis = an
         self.assertEqual(len(an.configs), 1)
         self.assertEqual(an.get_config("2017A"), cf)
+
+        # setting the same analysis again is a no-op
+        cf.analysis = an
+        self.assertEqual(len(an.configs), 1)
+        self.assertEqual(cf.analysis, an)
+
+        # adding the same config again keeps it in the index
+        an.add_config(cf, overwrite=True)
+        self.assertEqual(len(an.configs), 1)
+        self.assertEqual(cf.analysis, an)
+
+        # adding it to another analysis moves it
+        an2 = Analysis("ttH_cbb2", 2)
+        an2.add_config(cf)
+        self.assertEqual(len(an.configs), 0)
+        self.assertEqual(len(an2.configs), 1)
+        self.assertEqual(cf.analysis, an2)
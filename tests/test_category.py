@@ -36,6 +36,23 @@ class ChannelTest(unittest.TestCase):
         with self.assertRaises(Exception):
             e.add_parent_channel("DL", 4)
 
+    def test_categories(self):
+        c = Channel("test3", 10)
+        cat = c.add_category("test3_cat")
+        self.assertEqual(cat.channel, c)
+
+        # adding the same category again keeps it in the index
+        c.add_category(cat, overwrite=True)
+        self.assertEqual(len(c.categories), 1)
+        self.assertEqual(cat.channel, c)
+
+        # adding it to another channel moves it
+        c2 = Channel("test4", 11)
+        c2.add_category(cat)
+        self.assertEqual(len(c.categories), 0)
+        self.assertEqual(len(c2.categories), 1)
+        self.assertEqual(cat.channel, c2)
+
     def test_label(self):
         c = Channel("test2", 9)
 
@@ -151,6 +168,34 @@ class CategoryTest(unittest.TestCase):
         self.assertIsNone(c2.channel, SL)
         self.assertEqual(c.full_label, r"SL, $\eq$ 4 jets")
         self.assertEqual(c.full_label_root, "SL, #eq 4 jets")
+        self.assertEqual(c.full_label_short_root, "SL, #eq 4 jets")
+
+        # root labels follow label changes
+        SL.label = r"$\ell$+jets"
+        self.assertEqual(c.full_label_root, "#ell+jets, #eq 4 jets")
+        SL.label = None
+
+        # labels without fallback
+        SL._label_fallback_attr = None
+        self.assertEqual(c.full_label, r"None, $\eq$ 4 jets")
+        self.assertEqual(c.full_label_short, r"None, $\eq$ 4 jets")
+        self.assertEqual(c.full_label_root, "None, #eq 4 jets")
+        self.assertEqual(c.full_label_short_root, "None, #eq 4 jets")
+        SL._label_fallback_attr = "name"
+
+        # setting the same channel again is a no-op
+        c.channel = SL
+        self.assertEqual(len(SL.categories), 1)
+        self.assertEqual(c.channel, SL)
+
+        # changing the channel updates both indices
+        DL = Channel("DL", 2)
+        c.channel = DL
+        self.assertEqual(len(SL.categories), 0)
+        self.assertEqual(len(DL.categories), 1)
+        c.channel = None
+        self.assertEqual(len(DL.categories), 0)
+        self.assertIsNone(c.channel)
 
     def test_copy(self):
         SL = Channel("SL", 1)
@@ -51,6 +51,18 @@ class CampaignTest(unittest.TestCase):
         self.assertEqual(len(a.datasets), 0)
         self.assertEqual(len(b.datasets), 0)
 
+        # adding the same dataset again keeps it in the index
+        b.add_dataset(d)
+        b.add_dataset(d, overwrite=True)
+        self.assertEqual(len(b.datasets), 1)
+        self.assertEqual(d.campaign, "2017B")
+
+        # adding it to another campaign moves it
+        a.add_dataset(d)
+        self.assertEqual(len(a.datasets), 1)
+        self.assertEqual(len(b.datasets), 0)
+        self.assertEqual(d.campaign, "2017A")
+
     def test_copy(self):
         a = Campaign("2017A", 1)
         d = Dataset("ttH", 1, campaign=a)
@@ -92,6 +92,26 @@ class DatasetTest(unittest.TestCase):
         self.assertEqual(d["scale_down"].n_events, 40001)
         self.assertEqual(d["scale_down"].gen_order, "nlo")
 
+    def test_campaign(self):
+        c = Campaign("2017C", 3)
+        d = Dataset("WJets", 5, campaign=c)
+        self.assertEqual(len(c.datasets), 1)
+
+        # setting the same campaign again is a no-op
+        d.campaign = c
+        self.assertEqual(len(c.datasets), 1)
+        self.assertEqual(d.campaign, c)
+
+        # changing the campaign updates both indices
+        c2 = Campaign("2017D", 4)
+        d.campaign = c2
+        self.assertEqual(len(c.datasets), 0)
+        self.assertIn(d, c2.datasets)
+
+        d.campaign = None
+        self.assertEqual(len(c2.datasets), 0)
+        self.assertIsNone(d.campaign)
+
     def test_parsing(self):
         d = Dataset("DY", 4, n_files=10, n_events=10000)
 
@@ -101,6 +121,21 @@ class DatasetTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             d.info = "foo"
 
+        with self.assertRaises(TypeError):
+            d.info = 1
+
+        with self.assertRaises(TypeError):
+            d.info = {1: DatasetInfo()}
+
+        d.info = [("nominal", DatasetInfo(n_files=5))]
+        self.assertEqual(d.n_files, 5)
+
+        with self.assertRaises(TypeError):
+            d.set_info(1, DatasetInfo())
+
+        with self.assertRaises(TypeError):
+            d.set_info("scale_up", 1)
+
     def test_copy(self):
         c = Campaign("2017B", 2)
         d = Dataset(
@@ -157,12 +192,35 @@ class DatasetInfoTest(unittest.TestCase):
         self.assertEqual(d.n_events, 10000)
         self.assertEqual(d.gen_order, "nlo")
 
+    def test_defaults(self):
+        d = DatasetInfo()
+
+        self.assertEqual(d.keys, [])
+        self.assertEqual(d.n_files, -1)
+        self.assertEqual(d.n_events, -1)
+        self.assertIsNone(d.gen_order)
+
+        with self.assertRaises(TypeError):
+            DatasetInfo(n_files="foo")
+
     def test_attributes(self):
         d = DatasetInfo(keys="/ttH", n_files=100, n_events=10000, gen_order="nnlo")
 
         with self.assertRaises(TypeError):
             d.keys = 123
 
+        with self.assertRaises(TypeError):
+            d.keys = ["/ttH", 123]
+
+        keys = ["/ttH1", "/ttH2"]
+        d.keys = keys
+        self.assertEqual(d.keys, keys)
+        self.assertIsNot(d.keys, keys)
+
+        d.keys = (u"/ttH3",)
+        self.assertEqual(d.keys, ["/ttH3"])
+        self.assertIsInstance(d.keys[0], str)
+
         with self.assertRaises(TypeError):
             d.n_files = "foo"
 
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+
+__all__ = ["ImportTest"]
+
+
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+from .util import skip_if
+
+
+base = os.path.normpath(os.path.join(os.path.abspath(__file__), "../.."))
+
+
+def run_code(code):
+    # run code in a fresh interpreter and return the json-decoded last line of its output
+    cmd = [sys.executable, "-c", "import sys; sys.path.insert(0, {!r})\n{}".format(base, code)]
+    out = subprocess.check_output(cmd)
+    return json.loads(out.decode("utf-8").strip().splitlines()[-1])
+
+
+class ImportTest(unittest.TestCase):
+
+    @skip_if(sys.version_info < (3, 7))
+    def test_lazy_submodules(self):
+        loaded = run_code(
+            "import json, importlib.util, order\n"
+            "spec = importlib.util.find_spec('order')\n"
+            "print(json.dumps({\n"
+            "    'locations': len(set(spec.submodule_search_locations)),\n"
+            "    'modules': sorted(m for m in sys.modules if m.startswith('order.')),\n"
+            "}))",
+        )
+        self.assertEqual(loaded["locations"], 1)
+        for name in ["util", "unique", "mixins", "category", "variable", "shift", "process",
+                "dataset", "config", "analysis"]:
+            self.assertNotIn("order." + name, loaded["modules"])
+
+    @skip_if(sys.version_info < (3, 7))
+    def test_lazy_attributes(self):
+        loaded = run_code(
+            "import json, order\n"
+            "cls = order.Shift\n"
+            "print(json.dumps({\n"
+            "    'module': cls.__module__,\n"
+            "    'loaded': 'order.shift' in sys.modules,\n"
+            "    'category': 'order.category' in sys.modules,\n"
+            "    'all': all(hasattr(order, name) for name in order.__all__),\n"
+            "    'util': order.util.__name__,\n"
+            "}))",
+        )
+        self.assertEqual(loaded["module"], "order.shift")
+        self.assertTrue(loaded["loaded"])
+        self.assertFalse(loaded["category"])
+        self.assertTrue(loaded["all"])
+        self.assertEqual(loaded["util"], "order.util")
+
+    @skip_if(sys.version_info < (3, 7))
+    def test_lazy_cache(self):
+        loaded = run_code(
+            "import json, order\n"
+            "before = 'Config' in vars(order)\n"
+            "order.Config\n"
+            "print(json.dumps({\n"
+            "    'before': before,\n"
+            "    'config': 'Config' in vars(order),\n"
+            "    'campaign': 'Campaign' in vars(order),\n"
+            "    'variable': 'Variable' in vars(order),\n"
+            "}))",
+        )
+        self.assertFalse(loaded["before"])
+        self.assertTrue(loaded["config"])
+        self.assertTrue(loaded["campaign"])
+        self.assertFalse(loaded["variable"])
+
+    def test_submodule_attributes(self):
+        loaded = run_code(
+            "import json, order\n"
+            "names = ['util', 'unique', 'mixins', 'category', 'variable', 'shift', 'process',\n"
+            "    'dataset', 'config', 'analysis']\n"
+            "print(json.dumps({\n"
+            "    'modules': [getattr(order, name).__name__ for name in names],\n"
+            "    'private': [name for name in ['sys', 'importlib'] if hasattr(order, name)],\n"
+            "}))",
+        )
+        self.assertEqual(loaded["modules"], ["order." + name for name in ["util", "unique",
+            "mixins", "category", "variable", "shift", "process", "dataset", "config", "analysis"]])
+        self.assertEqual(loaded["private"], [])
+
+    def test_submodule_order(self):
+        # each submodule must be importable first, regardless of circular references
+        for name in ["util", "unique", "mixins", "category", "variable", "shift", "process",
+                "dataset", "config", "analysis"]:
+            loaded = run_code("import order.{}\nprint('true')".format(name))
+            self.assertTrue(loaded)
+
+    def test_unknown_attribute(self):
+        import order
+
+        with self.assertRaises(AttributeError):
+            order.foo
@@ -299,6 +299,33 @@ class LabelMixinTest(unittest.TestCase):
         obj.label = None
         self.assertIsNone(obj.label_short)
 
+    def test_cooperative_constructor(self):
+        class C(LabelMixin, TagMixin, AuxDataMixin):
+            pass
+
+        obj = C(label="foo", tags={"a"}, aux={"b": 1})
+
+        self.assertEqual(obj.label, "foo")
+        self.assertTrue(obj.has_tag("a"))
+        self.assertEqual(obj.x.b, 1)
+
+    def test_root_labels(self):
+        obj = LabelMixin(label=r"$\eq$ 3 jets")
+        self.assertEqual(obj.label_root, "#eq 3 jets")
+        self.assertEqual(obj.label_short_root, "#eq 3 jets")
+
+        obj.label = r"$\geq$ 4 jets"
+        self.assertEqual(obj.label_root, "#geq 4 jets")
+        obj.label_short = r"$\geq$4j"
+        self.assertEqual(obj.label_short_root, "#geq4j")
+
+        # fallback to the name
+        obj.label = None
+        obj.name = r"$\mu$"
+        self.assertEqual(obj.label_root, "#mu")
+        obj.name = r"$e$"
+        self.assertEqual(obj.label_root, "e")
+
 
 class ColorMixinTest(unittest.TestCase):
 
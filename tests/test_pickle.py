@@ -12,6 +12,31 @@ import order
 from .util import skip_if, has_module
 
 
+# an AuxDataMixin instance with aux data {"foo": "bar"}, pickled with protocol 0 by order 2.1.7
+aux_pickle = (
+    b"ccopy_reg\n_reconstructor\np0\n(corder.mixins\nAuxDataMixin\np1\nc__builtin__\no"
+    b"bject\np2\nNtp3\nRp4\n(dp5\nV_aux\np6\nccollections\nOrderedDict\np7\n(tRp8\nVfo"
+    b"o\np9\nVbar\np10\nssV_x\np11\ng0\n(corder.util\nDotAccessProxy\np12\ng2\nNtp13\n"
+    b"Rp14\n(dp15\nV_getter\np16\nc__builtin__\ngetattr\np17\n(g4\nVget_aux\np18\ntp19"
+    b"\nRp20\nsV_setter\np21\ng17\n(g4\nVset_aux\np22\ntp23\nRp24\nsbsb."
+)
+
+# an index containing the nominal shift, pickled with protocol 0 by order 2.1.7
+index_pickle = (
+    b"ccopy_reg\n_reconstructor\np0\n(corder.unique\nUniqueObjectIndex\np1\nc__builtin"
+    b"__\nobject\np2\nNtp3\nRp4\n(dp5\nV_cls\np6\ncorder.shift\nShift\np7\nsV_index\np"
+    b"8\n(lp9\ng0\n(g7\ng2\nNtp10\nRp11\n(dp12\nV_label\np13\nNsV_label_short\np14\nNs"
+    b"V_label_fallback_attr\np15\nVname\np16\nsV_tags\np17\nc__builtin__\nset\np18\n(("
+    b"lp19\ntp20\nRp21\nsV_aux\np22\nccollections\nOrderedDict\np23\n(tRp24\nsV_x\np25"
+    b"\ng0\n(corder.util\nDotAccessProxy\np26\ng2\nNtp27\nRp28\n(dp29\nV_getter\np30\n"
+    b"c__builtin__\ngetattr\np31\n(g11\nVget_aux\np32\ntp33\nRp34\nsV_setter\np35\ng31"
+    b"\n(g11\nVset_aux\np36\ntp37\nRp38\nsbsV_name\np39\nVnominal\np40\nsV_id\np41\nI0"
+    b"\nsV_source\np42\ng40\nsV_direction\np43\ng40\nsV_type\np44\nVrate_shape\np45\ns"
+    b"basV_lazy_factories\np46\n(dp47\nsV_n\np48\ng0\n(g26\ng2\nNtp49\nRp50\n(dp51\ng3"
+    b"0\ng31\n(g4\nVget\np52\ntp53\nRp54\nsg35\nNsbsb."
+)
+
+
 def mk_obj(cls, arg0=None, name=None, id=123):
     if name is None:
         name = cls.__name__.lower()
@@ -20,7 +45,7 @@ def mk_obj(cls, arg0=None, name=None, id=123):
 
 class PickleTest(unittest.TestCase):
 
-    def do_test(self, pickle):
+    def do_test(self, pickle, protocol=None):
         a = mk_obj(order.Analysis)
         cp = mk_obj(order.Campaign)
         ct = mk_obj(order.Category)
@@ -42,7 +67,7 @@ class PickleTest(unittest.TestCase):
         a.add_config(co)
 
         for x in a, cp, ct, ch, co, d, p, s, v:
-            y = pickle.dumps(x)
+            y = pickle.dumps(x, protocol)
             x2 = pickle.loads(y)
             self.assertEqual(x, x2)
 
@@ -51,6 +76,41 @@ class PickleTest(unittest.TestCase):
         import pickle
         self.do_test(pickle)
 
+    @skip_if(six.PY2)
+    def test_pickle_protocols(self):
+        import pickle
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.do_test(pickle, protocol)
+
+    @skip_if(six.PY2)
+    def test_pickle_index(self):
+        import pickle
+
+        # indices pickled by previous versions
+        idx = pickle.loads(index_pickle)
+        self.assertEqual(len(idx), 1)
+        self.assertEqual(idx.n.nominal.id, 0)
+
+        # all protocols
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            idx2 = pickle.loads(pickle.dumps(idx, protocol))
+            self.assertEqual(idx2.keys(), idx.keys())
+            self.assertEqual(idx2.n.nominal, idx.n.nominal)
+
+    @skip_if(six.PY2)
+    def test_pickle_aux_proxy(self):
+        import pickle
+
+        # objects pickled by previous versions
+        m = pickle.loads(aux_pickle)
+        self.assertEqual(m.x.foo, "bar")
+
+        # all protocols
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            m2 = pickle.loads(pickle.dumps(m, protocol))
+            self.assertEqual(m2.x.foo, "bar")
+            self.assertEqual(m2.aux, m.aux)
+
     @skip_if(not has_module("cloudpickle"))
     def test_cloudpickle(self):
         import cloudpickle
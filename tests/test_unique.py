@@ -172,6 +172,67 @@ class UniqueObjectIndexTest(unittest.TestCase):
         objs = idx.extend([("ex", 6)])
         self.assertEqual(len(idx), 6)
 
+        # duplicates within the same batch
+        objs = idx.extend([C("dup", 7), C("dup", 8)], overwrite=True)
+        self.assertEqual(len(idx), 7)
+        self.assertEqual(idx.get("dup").id, 8)
+        self.assertFalse(idx.has(7))
+
+        with self.assertRaises(DuplicateIdException):
+            idx.extend([C("dup2", 9), C("dup3", 9)])
+
+    def test_extend_like_add(self):
+        C, _ = self.make_index()
+
+        def make_index():
+            idx = UniqueObjectIndex(C)
+            for name, id in [("f", 5), ("a", 3), ("e", 4)]:
+                idx.add(C(name, id))
+            return idx
+
+        # objects that conflict with two different objects by name and by id
+        batch = [("e", 4), ("f", 1), ("f", 3), ("f", 5), ("f", 7)]
+        idx1, idx2 = make_index(), make_index()
+        idx1.extend([C(*args) for args in batch], overwrite=True)
+        for args in batch:
+            idx2.add(C(*args), overwrite=True)
+        self.assertEqual(idx1.keys(), idx2.keys())
+        self.assertEqual(idx1.keys(), [("e", 4), ("f", 5), ("f", 7)])
+
+        # constructors that add the new object to the index themselves
+        class D(C):
+            def __init__(self, name, id, index):
+                super(D, self).__init__(name, id)
+                index.add(self)
+
+        idx = UniqueObjectIndex(D)
+        idx.extend([dict(name="x", id=1, index=idx)], overwrite=True)
+        self.assertEqual(len(idx), 1)
+
+        idx = UniqueObjectIndex(D)
+        with self.assertRaises(DuplicateNameException):
+            idx.extend([dict(name="x", id=1, index=idx)])
+        self.assertEqual(len(idx), 1)
+
+    def test_extend_custom_add(self):
+        C, _ = self.make_index()
+
+        class CustomIndex(UniqueObjectIndex):
+            def __init__(self, *args, **kwargs):
+                self.added = []
+                super(CustomIndex, self).__init__(*args, **kwargs)
+
+            def add(self, *args, **kwargs):
+                obj = super(CustomIndex, self).add(*args, **kwargs)
+                self.added.append(obj.name)
+                return obj
+
+        idx = CustomIndex(C, [("foo", 1)])
+        objs = idx.extend([("bar", 2), dict(name="baz", id=3), C("test", 4)])
+        self.assertEqual([obj.name for obj in objs], ["bar", "baz", "test"])
+        self.assertEqual(idx.added, ["foo", "bar", "baz", "test"])
+        self.assertEqual(len(idx), 4)
+
     def test_get(self):
         C, idx = self.make_index()
 
@@ -464,6 +525,49 @@ class UniqueTreeTest(unittest.TestCase):
             [n4, n2, n1],
         )
 
+    def test_extend(self):
+        Node = self.make_class(parents=False)
+        Node.default_uniqueness_context = "node_extend"
+
+        n1 = Node("a", 1)
+        objs = n1.extend_nodes([("b", 2), dict(name="c", id=3), Node("d", 4)])
+        self.assertEqual([n.name for n in objs], ["b", "c", "d"])
+        self.assertEqual(len(n1.nodes), 3)
+
+        # custom add methods are still invoked per object
+        class CustomNode(Node):
+            added = []
+
+            def add_node(self, *args, **kwargs):
+                node = self.nodes.add(*args, **kwargs)
+                self.added.append(node)
+                return node
+
+        n2 = CustomNode("e", 5)
+        objs = n2.extend_nodes([("f", 6), ("g", 7)])
+        self.assertEqual(len(objs), 2)
+        self.assertEqual(CustomNode.added, objs)
+
+    def test_lazy_indices(self):
+        Node = self.make_class(deep_children=True, deep_parents=True, parents=-1)
+        Node.default_uniqueness_context = "node_lazy"
+
+        n1 = Node("a", 1)
+        n2 = n1.add_node("b", 2)
+
+        # read-only checks and traversals do not create indices
+        self.assertIsNone(n2._nodes)
+        self.assertIsNone(n1._parent_nodes)
+        self.assertTrue(n2.is_leaf_node)
+        self.assertTrue(n1.is_root_node)
+        self.assertEqual(len(list(n1.walk_nodes())), 1)
+        self.assertEqual(n1.get_node(3, default=None), None)
+        self.assertIsNone(n2._nodes)
+
+        # accessing the index creates it
+        self.assertEqual(len(n2.nodes), 0)
+        self.assertIsInstance(n2._nodes, UniqueObjectIndex)
+
     def test_lookup(self):
         Node = self.make_class(deep_children=True, deep_parents=True)
         Node.default_uniqueness_context = "node_lookup"